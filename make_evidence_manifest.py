@@ -7,6 +7,8 @@ Generates:
 - docs/evidence/SHA256SUMS
 - docs/evidence/INDEX.md (optional)
 - docs/evidence/WARNINGS.md (optional; enabled by default)
+- docs/evidence/.manifest_cache.json (field cache keyed by sha256; skipped with --no-cache)
+  Written into whichever folder --evidence names; .gitignore only covers docs/evidence.
 
 It extracts backend/shots/timestamp/job_ids from common JSON evidence patterns,
 including nested lists of runs.
@@ -16,23 +18,101 @@ Usage:
   python make_evidence_manifest.py --evidence docs/evidence
   python make_evidence_manifest.py --write-index
   python make_evidence_manifest.py --no-warnings
+  python make_evidence_manifest.py --no-cache   (re-parse every file; don't read or write .manifest_cache.json)
 """
 
 from __future__ import annotations
 
 import argparse
+import collections
+import concurrent.futures
+import dataclasses
 import datetime as dt
 import hashlib
+import itertools
 import json
+import mmap
 import os
 import re
 import subprocess
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+try:  # optional: faster JSON parse/serialize
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # optional: streaming parse for large evidence files
+    import ijson
+except ImportError:
+    ijson = None
 
 # Heuristics: IBM job ids often look like d0... (but keep flexible)
-JOB_ID_TOKEN_RE = re.compile(r"\b[a-z0-9]{10,40}\b", re.IGNORECASE)
 LIKELY_JOB_PREFIX = ("d0", "c0")  # extend if needed
+# 12-40 char tokens starting with a likely prefix; prefix + length filters live in the pattern
+JOB_ID_TOKEN_RE = re.compile(
+    r"\b(?:%s)[a-z0-9]{10,38}\b" % "|".join(LIKELY_JOB_PREFIX),
+    re.IGNORECASE,
+)
+
+# orjson silently turns integers outside [-2**63, 2**64) into floats; any 19+ digit run might be
+# one, so such documents go to the stdlib parser, which keeps them exact
+_LONG_DIGITS_RE = re.compile(rb"\d{19,}")
+
+SCHEMA_VERSION = 2
+
+# Extracted fields are cached per content hash in this file (inside the evidence dir).
+# Bump FIELDS_CACHE_VERSION whenever the extraction logic changes.
+FIELDS_CACHE_NAME = ".manifest_cache.json"
+FIELDS_CACHE_VERSION = 2
+
+# Files at least this large are hashed through a single mmap view
+MMAP_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# JSON files larger than this are streamed with ijson (when installed) instead of loaded whole.
+# Streaming is slower than parse + extract in memory (a per-event Python loop holding the GIL),
+# so it is reserved for files whose parsed tree (several times the file size) would strain memory.
+STREAM_THRESHOLD_BYTES = 128 * 1024 * 1024
+
+# JSON files up to this size are read once and hashed + parsed from the same buffer
+SINGLE_READ_MAX_BYTES = 8 * 1024 * 1024
+
+# Files hashed ahead of the (serial) parser, per hashing thread; bounds buffered reads to
+# roughly HASH_AHEAD_PER_WORKER * cpu_count * SINGLE_READ_MAX_BYTES
+HASH_AHEAD_PER_WORKER = 2
+
+# Key paths probed by the extract_* helpers, in priority order. The first hit wins, so every
+# earlier path must be probed even when files share a schema; skipping straight to the path
+# that matched a previous file would change results for files that also carry an earlier one.
+JOB_ID_KEYS = ("job_id", "jobId", "runtime_job_id")
+JOB_ID_LIST_KEYS = ("job_ids", "jobIds", "jobs", "ibm_job_ids")
+JOB_ID_PATHS = (
+    ("execution_metadata", "job_id"),
+    ("execution_metadata", "jobId"),
+    ("proof", "execution_metadata", "job_id"),
+    ("proof", "execution_metadata", "jobId"),
+    ("ibm", "job_id"),
+    ("ibm", "jobId"),
+)
+BACKEND_PATHS = (
+    ("backend",),
+    ("hardware", "backend"),
+    ("execution_metadata", "backend"),
+    ("proof", "execution_metadata", "backend"),
+    ("ibm", "backend"),
+    ("summary", "backend"),
+)
+SHOTS_PATHS = (
+    ("shots",),
+    ("summary", "shots"),
+    ("execution_metadata", "shots"),
+    ("proof", "execution_metadata", "shots"),
+    ("ibm", "shots"),
+)
+SHOTS_LIST_KEYS = ("runs", "results", "jobs", "executions")
+TIMESTAMP_KEYS = ("timestamp", "created_utc", "created", "time", "date")
+TIMESTAMP_PATHS = (("summary", "timestamp"), ("metadata", "timestamp"), ("execution_metadata", "timestamp"))
 
 
 # ---------------------------
@@ -40,13 +120,41 @@ LIKELY_JOB_PREFIX = ("d0", "c0")  # extend if needed
 # ---------------------------
 
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
+    with path.open("rb", buffering=0) as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD_BYTES:  # never empty, so mmap is safe everywhere
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: read+update loop runs in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        buf = bytearray(4 * 1024 * 1024)
+        view = memoryview(buf)
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
     return h.hexdigest()
 
 
+def _loads(data: bytes) -> Any:
+    if orjson is not None and not _LONG_DIGITS_RE.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # stdlib also accepts NaN/Infinity
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass  # integers beyond 64 bits; stdlib writes them exactly
+    return json.dumps(obj, indent=2, sort_keys=True).encode("utf-8")
+
+
 def try_git_commit(repo_root: Path) -> str:
     if not (repo_root / ".git").exists():
         return "unknown"
@@ -64,23 +172,25 @@ def try_git_commit(repo_root: Path) -> str:
     return "unknown"
 
 
-def ensure_text(s: Any) -> str:
-    if isinstance(s, str):
-        return s
-    return str(s)
+def walk_all_values(obj: Any) -> Iterator[Any]:
+    """Yield all leaf values (and dict keys, each before its value) from nested json-like structures.
 
-
-def walk_all_values(obj: Any):
-    """Yield all leaf values from nested json-like structures."""
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            yield k
-            yield from walk_all_values(v)
-    elif isinstance(obj, list):
-        for v in obj:
-            yield from walk_all_values(v)
-    else:
-        yield obj
+    Uses an explicit stack of iterators instead of recursive generators, so the cost per
+    leaf does not grow with nesting depth. Order is depth-first, same as document order.
+    """
+    stack: List[Iterator[Any]] = [iter((obj,))]
+    while stack:
+        for x in stack[-1]:
+            t = type(x)
+            if t is dict:
+                stack.append(itertools.chain.from_iterable(x.items()))
+                break
+            if t is list:
+                stack.append(iter(x))
+                break
+            yield x
+        else:
+            stack.pop()
 
 
 def find_first_str(obj: Any, keys: List[str]) -> Optional[str]:
@@ -93,12 +203,15 @@ def find_first_str(obj: Any, keys: List[str]) -> Optional[str]:
     return None
 
 
-def deep_get(obj: Any, path: List[str]) -> Optional[Any]:
+def deep_get(obj: Any, path: Sequence[str]) -> Optional[Any]:
+    # Parsed JSON only ever holds plain dicts, so `type(...) is dict` is exact (and skips the MRO walk).
     cur = obj
     for k in path:
-        if not isinstance(cur, dict) or k not in cur:
+        if type(cur) is not dict:
+            return None
+        cur = cur.get(k)
+        if cur is None:
             return None
-        cur = cur[k]
     return cur
 
 
@@ -106,16 +219,12 @@ def deep_get(obj: Any, path: List[str]) -> Optional[Any]:
 # Extraction
 # ---------------------------
 
-def extract_job_ids_from_text(text: str) -> List[str]:
-    cands = JOB_ID_TOKEN_RE.findall(text.lower())
-    ids = [c for c in cands if c.startswith(LIKELY_JOB_PREFIX) and len(c) >= 12]
-    seen: Set[str] = set()
-    out: List[str] = []
-    for x in ids:
-        if x not in seen:
-            seen.add(x)
-            out.append(x)
-    return out
+def extract_job_ids_from_text(text: str, _lowered: bool = False) -> List[str]:
+    """Job ids found in `text`; `_lowered` skips re-lowercasing."""
+    ids: Iterator[str] = iter(JOB_ID_TOKEN_RE.findall(text))
+    if not _lowered:
+        ids = (x.lower() for x in ids)
+    return list(dict.fromkeys(ids))
 
 
 def extract_job_ids(obj: Any) -> List[str]:
@@ -123,33 +232,40 @@ def extract_job_ids(obj: Any) -> List[str]:
 
     # 1) common direct keys
     if isinstance(obj, dict):
-        for k in ("job_id", "jobId", "runtime_job_id"):
+        for k in JOB_ID_KEYS:
             v = obj.get(k)
             if isinstance(v, str):
                 ids.append(v)
-        for k in ("job_ids", "jobIds", "jobs", "ibm_job_ids"):
+        for k in JOB_ID_LIST_KEYS:
             v = obj.get(k)
             if isinstance(v, list):
                 ids.extend([x for x in v if isinstance(x, str)])
 
     # 2) common nested keys
-    nested_paths = [
-        ["execution_metadata", "job_id"],
-        ["execution_metadata", "jobId"],
-        ["proof", "execution_metadata", "job_id"],
-        ["proof", "execution_metadata", "jobId"],
-        ["ibm", "job_id"],
-        ["ibm", "jobId"],
-    ]
-    for p in nested_paths:
+    for p in JOB_ID_PATHS:
         v = deep_get(obj, p)
         if isinstance(v, str):
             ids.append(v)
 
-    # 3) scan strings everywhere (robust)
-    all_text = "\n".join(ensure_text(v) for v in walk_all_values(obj) if isinstance(v, (str, int, float)))
-    ids.extend(extract_job_ids_from_text(all_text))
+    out = normalize_job_ids(ids)
+    if out:
+        return out
+
+    # 3) scan strings everywhere (robust); only needed when no structured key matched
+    if not isinstance(obj, dict):
+        return []
+    return normalize_job_ids(list(scan_job_ids(obj)))
 
+
+def scan_job_ids(obj: Any) -> Iterator[str]:
+    """Yield job-id tokens from string leaves long enough to contain one."""
+    for v in walk_all_values(obj):
+        if isinstance(v, str) and len(v) >= 12:
+            for m in JOB_ID_TOKEN_RE.findall(v):
+                yield m.lower()
+
+
+def normalize_job_ids(ids: List[Any]) -> List[str]:
     # normalize + dedupe
     out: List[str] = []
     seen: Set[str] = set()
@@ -170,15 +286,7 @@ def extract_job_ids(obj: Any) -> List[str]:
 
 def extract_backend(obj: Any) -> Optional[str]:
     # common locations
-    candidates = [
-        ["backend"],
-        ["hardware", "backend"],
-        ["execution_metadata", "backend"],
-        ["proof", "execution_metadata", "backend"],
-        ["ibm", "backend"],
-        ["summary", "backend"],
-    ]
-    for p in candidates:
+    for p in BACKEND_PATHS:
         v = deep_get(obj, p)
         if isinstance(v, str) and v.strip():
             return v.strip()
@@ -191,14 +299,7 @@ def extract_backend(obj: Any) -> Optional[str]:
 
 
 def extract_shots(obj: Any) -> Optional[int]:
-    candidates = [
-        ["shots"],
-        ["summary", "shots"],
-        ["execution_metadata", "shots"],
-        ["proof", "execution_metadata", "shots"],
-        ["ibm", "shots"],
-    ]
-    for p in candidates:
+    for p in SHOTS_PATHS:
         v = deep_get(obj, p)
         if isinstance(v, int) and v > 0:
             return v
@@ -207,11 +308,11 @@ def extract_shots(obj: Any) -> Optional[int]:
 
     # fallback: search for {"shots": N} in nested runs list
     if isinstance(obj, dict):
-        for k in ("runs", "results", "jobs", "executions"):
+        for k in SHOTS_LIST_KEYS:
             v = obj.get(k)
             if isinstance(v, list):
                 for item in v:
-                    vv = deep_get(item, ["shots"])
+                    vv = item.get("shots") if type(item) is dict else None
                     if isinstance(vv, int) and vv > 0:
                         return vv
     return None
@@ -220,13 +321,13 @@ def extract_shots(obj: Any) -> Optional[int]:
 def extract_timestamp(obj: Any) -> Optional[str]:
     # common keys
     if isinstance(obj, dict):
-        for k in ("timestamp", "created_utc", "created", "time", "date"):
+        for k in TIMESTAMP_KEYS:
             v = obj.get(k)
             if isinstance(v, str) and v.strip():
                 return v.strip()
 
     # nested
-    for p in (["summary", "timestamp"], ["metadata", "timestamp"], ["execution_metadata", "timestamp"]):
+    for p in TIMESTAMP_PATHS:
         v = deep_get(obj, p)
         if isinstance(v, str) and v.strip():
             return v.strip()
@@ -246,104 +347,375 @@ def detect_evidence_group_id(obj: Any, fallback: str) -> str:
 # Files + outputs
 # ---------------------------
 
-def build_entry(file_path: Path, base_dir: Path, obj: Optional[Dict[str, Any]], git_commit: str) -> Dict[str, Any]:
-    rel = str(file_path.relative_to(base_dir))
-    entry: Dict[str, Any] = {
-        "file": rel,
-        "sha256": sha256_file(file_path),
-        "size_bytes": file_path.stat().st_size,
-        "git_commit": git_commit,
-    }
+def pack_fields(
+    group_id: Optional[str],
+    backend: Optional[str],
+    ts: Optional[str],
+    shots: Optional[int],
+    job_ids: List[str],
+) -> Dict[str, Any]:
+    fields: Dict[str, Any] = {}
+    if group_id:
+        fields["evidence_group_id"] = group_id
+    if backend:
+        fields["backend"] = backend
+    if ts:
+        fields["timestamp"] = ts
+    if shots is not None:
+        fields["shots"] = shots
+    if job_ids:
+        fields["job_ids"] = job_ids
+    return fields
+
+
+def extract_fields(obj: Dict[str, Any]) -> Dict[str, Any]:
+    return pack_fields(
+        detect_evidence_group_id(obj, ""),
+        extract_backend(obj),
+        extract_timestamp(obj),
+        extract_shots(obj),
+        extract_job_ids(obj),
+    )
+
+
+_CONTAINER = object()  # marks a dict/list value seen while streaming
+
+
+def stream_extract_fields(file_path: Path) -> Optional[Dict[str, Any]]:
+    """Single ijson pass computing what extract_fields() would, without loading the file.
+
+    Only values on the known key paths are kept, plus the first "ibm_" string and the
+    job-id tokens needed by the scan fallbacks. Returns None if ijson cannot parse the file,
+    which includes the NaN/Infinity tokens that json.dumps writes by default.
+    """
+    wanted: Set[Tuple[str, ...]] = set(BACKEND_PATHS + SHOTS_PATHS + TIMESTAMP_PATHS + JOB_ID_PATHS)
+    wanted.update((k,) for k in TIMESTAMP_KEYS + JOB_ID_KEYS + ("evidence_group_id",))
+
+    found: Dict[Tuple[str, ...], Any] = {}
+    id_lists: Dict[str, List[str]] = {}  # JOB_ID_LIST_KEYS -> string items
+    run_shots: Dict[str, int] = {}  # SHOTS_LIST_KEYS -> first positive item["shots"]
+    first_ibm: Optional[str] = None
+    scanned: Dict[str, None] = {}
+    path: List[Optional[str]] = []  # None marks a list element
+    root_is_dict: Optional[bool] = None
+
+    try:
+        with file_path.open("rb") as f:
+            for event, value in ijson.basic_parse(f, use_float=True):
+                if event in ("end_map", "end_array"):
+                    path.pop()
+                    continue
+                if root_is_dict is None:
+                    root_is_dict = event == "start_map"
+
+                if event == "map_key":
+                    path[-1] = value
+                    s = value  # keys are scanned too, like walk_all_values()
+                else:
+                    key = tuple(path)
+                    container = event in ("start_map", "start_array")
+                    if root_is_dict:
+                        if key in wanted:
+                            found[key] = _CONTAINER if container else value
+                        if len(key) == 1 and key[0] in JOB_ID_LIST_KEYS:
+                            id_lists.pop(key[0], None)
+                            if event == "start_array":
+                                id_lists[key[0]] = []
+                        elif len(key) == 2 and key[1] is None and key[0] in id_lists:
+                            if event == "string":
+                                id_lists[key[0]].append(value)
+                        elif len(key) == 3 and key[1] is None and key[2] == "shots" and key[0] in SHOTS_LIST_KEYS:
+                            if isinstance(value, int) and value > 0:
+                                run_shots.setdefault(key[0], value)
+                    if container:
+                        path.append(None)
+                    s = value if event == "string" else None
+
+                if s:
+                    if first_ibm is None and s.startswith("ibm_"):
+                        first_ibm = s
+                    if len(s) >= 12:
+                        for m in JOB_ID_TOKEN_RE.findall(s):
+                            scanned[m.lower()] = None
+    except Exception:
+        return None
+
+    def first_str(keys) -> Optional[str]:
+        for k in keys:
+            v = found.get(k)
+            if isinstance(v, str) and v.strip():
+                return v.strip()
+        return None
 
-    # Assign group id
-    entry["evidence_group_id"] = detect_evidence_group_id(obj, file_path.stem) if obj else file_path.stem
+    backend = first_str(BACKEND_PATHS) or first_ibm
+
+    shots: Optional[int] = None
+    for p in SHOTS_PATHS:
+        v = found.get(p)
+        if isinstance(v, int) and v > 0:
+            shots = v
+            break
+        if isinstance(v, str) and v.isdigit():
+            shots = int(v)
+            break
+    else:
+        shots = next((run_shots[k] for k in SHOTS_LIST_KEYS if k in run_shots), None)
 
-    # Extract metadata if JSON
-    if obj:
-        backend = extract_backend(obj)
-        ts = extract_timestamp(obj)
-        shots = extract_shots(obj)
-        job_ids = extract_job_ids(obj)
+    ts = first_str([(k,) for k in TIMESTAMP_KEYS]) or first_str(TIMESTAMP_PATHS)
 
-        if backend:
-            entry["backend"] = backend
-        if ts:
-            entry["timestamp"] = ts
-        if shots is not None:
-            entry["shots"] = shots
-        if job_ids:
-            entry["job_ids"] = job_ids
+    ids: List[Any] = [found.get((k,)) for k in JOB_ID_KEYS]
+    for k in JOB_ID_LIST_KEYS:
+        ids.extend(id_lists.get(k, ()))
+    ids.extend(found.get(p) for p in JOB_ID_PATHS)
+    job_ids = normalize_job_ids(ids)
+    if not job_ids:
+        job_ids = normalize_job_ids(list(scanned))
 
-    return entry
+    return pack_fields(first_str([("evidence_group_id",)]), backend, ts, shots, job_ids)
 
 
-def write_sha256sums(base_dir: Path, entries: List[Dict[str, Any]]) -> None:
-    lines = [f"{e['sha256']}  {e['file']}" for e in sorted(entries, key=lambda x: x["file"])]
-    (base_dir / "SHA256SUMS").write_text("\n".join(lines) + "\n", encoding="utf-8")
+def parse_evidence_obj(data: bytes) -> Optional[Dict[str, Any]]:
+    try:
+        obj0 = _loads(data)
+        return obj0 if isinstance(obj0, dict) else {"_root": obj0}
+    except Exception:
+        return None
 
 
-def write_index_md(base_dir: Path, manifest: Dict[str, Any]) -> None:
+def load_evidence_obj(file_path: Path) -> Optional[Dict[str, Any]]:
+    if file_path.suffix.lower() != ".json":
+        return None
+    try:
+        data = file_path.read_bytes()
+    except OSError:
+        return None
+    return parse_evidence_obj(data)
+
+
+def iter_evidence_files(base_dir: Path) -> Iterator[Tuple[Path, int]]:
+    """Yield (path, size) for .json/.md files under base_dir, like rglob("*") but via os.scandir.
+
+    DirEntry caches the file type from the directory listing, so only matching files cost a
+    stat call. Symlinked directories are not descended into, same as rglob.
+    """
+    stack = [str(base_dir)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name == FIELDS_CACHE_NAME:
+                    continue
+                elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in (".json", ".md"):
+                    yield Path(entry.path), entry.stat().st_size
+
+
+def load_evidence_fields(file_path: Path, size: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    if file_path.suffix.lower() != ".json":
+        return None
+    if size is None:
+        size = file_path.stat().st_size
+    if ijson is not None and size > STREAM_THRESHOLD_BYTES:
+        fields = stream_extract_fields(file_path)
+        if fields is not None:
+            return fields
+        # ijson rejects NaN/Infinity; _loads() accepts them, so retry in memory before giving up
+    obj = load_evidence_obj(file_path)
+    return extract_fields(obj) if obj else None
+
+
+def load_fields_cache(path: Path) -> Dict[str, Optional[Dict[str, Any]]]:
+    """sha256 -> extracted fields (None for unparsable JSON); empty if missing or stale."""
+    try:
+        data = _loads(path.read_bytes())
+    except Exception:
+        return {}
+    if (
+        not isinstance(data, dict)
+        or data.get("schema_version") != SCHEMA_VERSION
+        or data.get("cache_version") != FIELDS_CACHE_VERSION
+        or not isinstance(data.get("fields"), dict)
+    ):
+        return {}
+    return data["fields"]
+
+
+def write_fields_cache(path: Path, fields_by_sha256: Dict[str, Optional[Dict[str, Any]]]) -> None:
+    data = {
+        "schema_version": SCHEMA_VERSION,
+        "cache_version": FIELDS_CACHE_VERSION,
+        "fields": fields_by_sha256,
+    }
+    path.write_bytes(_dumps(data))
+
+
+def read_and_digest(
+    file_path: Path,
+    size: int,
+    cache: Dict[str, Optional[Dict[str, Any]]],
+) -> Tuple[str, Optional[bytes]]:
+    """sha256 of a file, plus its bytes if it is a small JSON file whose fields still need parsing.
+
+    Small JSON files are read once and hashed from that buffer so the parse can reuse it; anything
+    larger is hashed in bounded memory and read again by evidence_fields().
+    """
+    if file_path.suffix.lower() == ".json" and size <= SINGLE_READ_MAX_BYTES:
+        data = file_path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        return digest, None if digest in cache else data
+    return sha256_file(file_path), None
+
+
+def evidence_fields(file_path: Path, size: int, data: Optional[bytes]) -> Optional[Dict[str, Any]]:
+    """Extracted fields for a JSON file, from `data` when read_and_digest() kept the bytes."""
+    if data is None:
+        return load_evidence_fields(file_path, size)
+    obj = parse_evidence_obj(data)
+    return extract_fields(obj) if obj else None
+
+
+@dataclasses.dataclass
+class EvidenceTable:
+    """Evidence entries stored column-wise; per-file dicts are only built for manifest.json."""
+
+    git_commit: str
+    files: List[str] = dataclasses.field(default_factory=list)
+    sha256s: List[str] = dataclasses.field(default_factory=list)
+    sizes: List[int] = dataclasses.field(default_factory=list)
+    group_ids: List[str] = dataclasses.field(default_factory=list)
+    backends: List[Optional[str]] = dataclasses.field(default_factory=list)
+    timestamps: List[Optional[str]] = dataclasses.field(default_factory=list)
+    shots: List[Optional[int]] = dataclasses.field(default_factory=list)
+    job_ids: List[Optional[List[str]]] = dataclasses.field(default_factory=list)
+
+    def add(
+        self,
+        file_path: Path,
+        base_dir: Path,
+        fields: Optional[Dict[str, Any]],
+        sha256: str,
+        size: int,
+    ) -> None:
+        # Metadata extracted from JSON (may override evidence_group_id)
+        fields = fields or {}
+        self.files.append(str(file_path.relative_to(base_dir)))
+        self.sha256s.append(sha256)
+        self.sizes.append(size)
+        self.group_ids.append(fields.get("evidence_group_id") or file_path.stem)
+        self.backends.append(fields.get("backend"))
+        self.timestamps.append(fields.get("timestamp"))
+        self.shots.append(fields.get("shots"))
+        self.job_ids.append(fields.get("job_ids"))
+
+    def sorted_rows(self) -> List[int]:
+        """Row indices ordered by file path."""
+        return sorted(range(len(self.files)), key=self.files.__getitem__)
+
+    def entry(self, i: int) -> Dict[str, Any]:
+        e: Dict[str, Any] = {
+            "file": self.files[i],
+            "sha256": self.sha256s[i],
+            "size_bytes": self.sizes[i],
+            "git_commit": self.git_commit,
+            "evidence_group_id": self.group_ids[i],
+        }
+        if self.backends[i] is not None:
+            e["backend"] = self.backends[i]
+        if self.timestamps[i] is not None:
+            e["timestamp"] = self.timestamps[i]
+        if self.shots[i] is not None:
+            e["shots"] = self.shots[i]
+        if self.job_ids[i] is not None:
+            e["job_ids"] = self.job_ids[i]
+        return e
+
+
+def write_manifest(path: Path, header: Dict[str, Any], table: EvidenceTable) -> None:
+    """Write manifest.json one entry at a time; same bytes as _dumps({**header, "evidence_sets": entries}).
+
+    Only one per-file dict is alive at a time, instead of the whole list plus its encoded copy.
+    """
+    head, tail = _dumps({**header, "evidence_sets": []}).split(b'"evidence_sets": []', 1)
+    with path.open("wb") as out:
+        out.write(head)
+        out.write(b'"evidence_sets": [')
+        for i in range(len(table.files)):
+            out.write(b",\n    " if i else b"\n    ")
+            # entries sit two levels deep; JSON strings never contain raw newlines
+            out.write(_dumps(table.entry(i)).replace(b"\n", b"\n    "))
+        out.write(b"\n  ]" if table.files else b"]")
+        out.write(tail)
+
+
+def write_sha256sums(base_dir: Path, table: EvidenceTable) -> None:
+    payload = "".join(f"{h}  {f}\n" for f, h in sorted(zip(table.files, table.sha256s)))
+    (base_dir / "SHA256SUMS").write_bytes(payload.encode("utf-8"))
+
+
+def write_index_md(base_dir: Path, table: EvidenceTable, generated_utc: str) -> None:
     lines: List[str] = []
     lines.append("# Evidence Index — docs/evidence")
     lines.append("")
-    lines.append(f"- Generated: {manifest['generated_utc']}")
-    lines.append(f"- Git commit: `{manifest['git_commit']}`")
+    lines.append(f"- Generated: {generated_utc}")
+    lines.append(f"- Git commit: `{table.git_commit}`")
     lines.append("")
     lines.append("## Files")
     lines.append("")
-    for e in sorted(manifest["evidence_sets"], key=lambda x: x["file"]):
-        lines.append(f"### {e['file']}")
-        lines.append(f"- SHA256: `{e['sha256']}`")
-        if "backend" in e:
-            lines.append(f"- Backend: `{e['backend']}`")
-        if "shots" in e:
-            lines.append(f"- Shots: `{e['shots']}`")
-        if "timestamp" in e:
-            lines.append(f"- Timestamp: `{e['timestamp']}`")
-        if "job_ids" in e:
-            lines.append(f"- Job IDs ({len(e['job_ids'])}):")
-            for jid in e["job_ids"]:
+    for i in table.sorted_rows():
+        lines.append(f"### {table.files[i]}")
+        lines.append(f"- SHA256: `{table.sha256s[i]}`")
+        if table.backends[i] is not None:
+            lines.append(f"- Backend: `{table.backends[i]}`")
+        if table.shots[i] is not None:
+            lines.append(f"- Shots: `{table.shots[i]}`")
+        if table.timestamps[i] is not None:
+            lines.append(f"- Timestamp: `{table.timestamps[i]}`")
+        job_ids = table.job_ids[i]
+        if job_ids is not None:
+            lines.append(f"- Job IDs ({len(job_ids)}):")
+            for jid in job_ids:
                 lines.append(f"  - `{jid}`")
-        lines.append(f"- evidence_group_id: `{e['evidence_group_id']}`")
+        lines.append(f"- evidence_group_id: `{table.group_ids[i]}`")
         lines.append("")
-    (base_dir / "INDEX.md").write_text("\n".join(lines), encoding="utf-8")
-
+    (base_dir / "INDEX.md").write_bytes("\n".join(lines).encode("utf-8"))
 
-def write_warnings_md(base_dir: Path, manifest: Dict[str, Any]) -> None:
-    sets = manifest["evidence_sets"]
 
+def write_warnings_md(base_dir: Path, table: EvidenceTable, generated_utc: str) -> None:
     # Collect job IDs from JSON evidence
     json_job_ids: Set[str] = set()
     dashboard_job_ids: Set[str] = set()
+    json_rows: List[int] = []
 
     # Identify dashboard markdowns and extract job ids from their text
-    for e in sets:
-        f = e["file"]
+    for i, f in enumerate(table.files):
         p = base_dir / f
         if f.lower().endswith(".md"):
-            text = p.read_text(encoding="utf-8", errors="ignore")
-            ids = extract_job_ids_from_text(text)
+            # Decoded (not raw bytes) so \b sees non-ASCII letters as word characters, as before;
+            # lowered once for both the marker check and the id scan
+            lowered = p.read_text(encoding="utf-8", errors="ignore").lower()
             # heuristically, treat "dashboard evidence" as any md containing "Dashboard" or "IBM Quantum Dashboard"
-            if "dashboard" in text.lower():
-                dashboard_job_ids.update(ids)
+            if "dashboard" in lowered:
+                dashboard_job_ids.update(extract_job_ids_from_text(lowered, _lowered=True))
 
-        if f.lower().endswith(".json") and "job_ids" in e:
-            json_job_ids.update([jid.lower() for jid in e["job_ids"]])
+        if f.lower().endswith(".json"):
+            json_rows.append(i)
+            if table.job_ids[i] is not None:
+                json_job_ids.update([jid.lower() for jid in table.job_ids[i]])
 
     # Find mismatches: dashboard ids not in json ids
     missing_in_json = sorted([jid for jid in dashboard_job_ids if jid.lower() not in json_job_ids])
 
     # Lint for missing fields
-    missing_backend = [e["file"] for e in sets if e["file"].lower().endswith(".json") and "backend" not in e]
-    missing_shots = [e["file"] for e in sets if e["file"].lower().endswith(".json") and "shots" not in e]
-    missing_timestamp = [e["file"] for e in sets if e["file"].lower().endswith(".json") and "timestamp" not in e]
-    missing_job_ids = [e["file"] for e in sets if e["file"].lower().endswith(".json") and "job_ids" not in e]
+    missing_backend = [table.files[i] for i in json_rows if table.backends[i] is None]
+    missing_shots = [table.files[i] for i in json_rows if table.shots[i] is None]
+    missing_timestamp = [table.files[i] for i in json_rows if table.timestamps[i] is None]
+    missing_job_ids = [table.files[i] for i in json_rows if table.job_ids[i] is None]
 
     lines: List[str] = []
     lines.append("# Evidence Warnings / Consistency Report")
     lines.append("")
-    lines.append(f"- Generated: {manifest['generated_utc']}")
-    lines.append(f"- Git commit: `{manifest['git_commit']}`")
+    lines.append(f"- Generated: {generated_utc}")
+    lines.append(f"- Git commit: `{table.git_commit}`")
     lines.append("")
 
     if missing_in_json:
@@ -373,7 +745,7 @@ def write_warnings_md(base_dir: Path, manifest: Dict[str, Any]) -> None:
         lines.append("No issues detected by current heuristics. ✅")
         lines.append("")
 
-    (base_dir / "WARNINGS.md").write_text("\n".join(lines), encoding="utf-8")
+    (base_dir / "WARNINGS.md").write_bytes("\n".join(lines).encode("utf-8"))
 
 
 def main() -> int:
@@ -381,6 +753,7 @@ def main() -> int:
     ap.add_argument("--evidence", default="docs/evidence", help="Evidence folder")
     ap.add_argument("--write-index", action="store_true", help="Also write INDEX.md")
     ap.add_argument("--no-warnings", action="store_true", help="Do not write WARNINGS.md")
+    ap.add_argument("--no-cache", action="store_true", help=f"Ignore and do not write {FIELDS_CACHE_NAME}")
     args = ap.parse_args()
 
     repo_root = Path(__file__).resolve().parent
@@ -392,37 +765,56 @@ def main() -> int:
     git_commit = try_git_commit(repo_root)
     generated_utc = dt.datetime.now(dt.timezone.utc).isoformat()
 
-    entries: List[Dict[str, Any]] = []
+    table = EvidenceTable(git_commit=git_commit)
 
-    candidates = sorted(
-        [p for p in base_dir.rglob("*") if p.is_file() and p.suffix.lower() in (".json", ".md")]
-    )
+    found = sorted(iter_evidence_files(base_dir), key=lambda t: t[0])
+    candidates = [p for p, _ in found]
+    sizes = [n for _, n in found]
 
-    for p in candidates:
-        obj = None
-        if p.suffix.lower() == ".json":
-            try:
-                obj0 = json.loads(p.read_text(encoding="utf-8"))
-                obj = obj0 if isinstance(obj0, dict) else {"_root": obj0}
-            except Exception:
-                obj = None
+    cache_path = base_dir / FIELDS_CACHE_NAME
+    cache = {} if args.no_cache else load_fields_cache(cache_path)
+    seen: Dict[str, Optional[Dict[str, Any]]] = {}
 
-        entry = build_entry(p, base_dir, obj, git_commit)
-        entries.append(entry)
-
-    manifest: Dict[str, Any] = {
-        "schema_version": 2,
+    def consume(p: Path, size: int, fut: concurrent.futures.Future) -> None:
+        digest, data = fut.result()
+        fields = None
+        if p.suffix.lower() == ".json":
+            # Each distinct content is parsed once per run: copies of a file parsed earlier in this
+            # run, and contents seen by an earlier run, come from the cache
+            if digest in cache:
+                fields = cache[digest]
+            else:
+                fields = cache[digest] = evidence_fields(p, size, data)
+            seen[digest] = fields
+        table.add(p, base_dir, fields, digest, size)
+
+    # Hashing and file reads release the GIL, so threads scale with cores here. Parsing holds it,
+    # so it stays on this thread, one file at a time (baseline peak memory), while the pool hashes
+    # a bounded window of files ahead.
+    workers = os.cpu_count() or 1
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+        ahead: Deque[Tuple[Path, int, concurrent.futures.Future]] = collections.deque()
+        for p, size in zip(candidates, sizes):
+            ahead.append((p, size, ex.submit(read_and_digest, p, size, cache)))
+            if len(ahead) > HASH_AHEAD_PER_WORKER * workers:
+                consume(*ahead.popleft())
+        while ahead:
+            consume(*ahead.popleft())
+
+    if not args.no_cache:
+        write_fields_cache(cache_path, seen)
+
+    header: Dict[str, Any] = {
+        "schema_version": SCHEMA_VERSION,
         "generated_utc": generated_utc,
         "git_commit": git_commit,
-        "evidence_sets": entries,
     }
-
-    (base_dir / "manifest.json").write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
-    write_sha256sums(base_dir, entries)
+    write_manifest(base_dir / "manifest.json", header, table)
+    write_sha256sums(base_dir, table)
     if args.write_index:
-        write_index_md(base_dir, manifest)
+        write_index_md(base_dir, table, generated_utc)
     if not args.no_warnings:
-        write_warnings_md(base_dir, manifest)
+        write_warnings_md(base_dir, table, generated_utc)
 
     print(f"Wrote: {base_dir / 'manifest.json'}")
     print(f"Wrote: {base_dir / 'SHA256SUMS'}")